@@ -5,7 +5,6 @@ A collection of general commands.
 """
 from __future__ import annotations
 
-import logging
 from typing import TYPE_CHECKING
 
 import discord
@@ -17,27 +16,32 @@ from src.env import COLOUR
 if TYPE_CHECKING:
     from src.bot import Bot
 
-logger = logging.getLogger(__name__)
-
 
 class General(Cog):
     """A collection of general commands."""
 
     def __init__(self, bot: Bot) -> None:
         self.bot = bot
+        self._info_embed: discord.Embed | None = None
+        # The footer only depends on the bot version, so format it up front
+        self._info_footer = f"Bot version: {bot.version} · Please leave a star on my GitHub repo. <3"
 
     @commands.hybrid_command(aliases=["about"])
     async def info(self, ctx: commands.Context[Bot]) -> None:
         """Shows info about me."""
-        embed = discord.Embed(
-            description=f"**{self.bot.user.name}** "  # type: ignore[reportOptionalMemberAccess]
-            'is a "helper" bot made by Taku.\n\n'
-            "My source code can be found "
-            "[here](https://github.com/Taaku18/discord-message-scheduler).",
-            colour=COLOUR,
-        )
-        embed.set_footer(text=f"Bot version: {self.bot.version} · Please leave a star on my GitHub repo. <3")
-        await ctx.send(embed=embed)
+        if self._info_embed is None:
+            # The embed doesn't depend on ctx, so build it once on first use
+            # (bot.user is only available after login) and reuse it afterwards.
+            embed = discord.Embed(
+                description=f"**{self.bot.user.name}** "  # type: ignore[reportOptionalMemberAccess]
+                'is a "helper" bot made by Taku.\n\n'
+                "My source code can be found "
+                "[here](https://github.com/Taaku18/discord-message-scheduler).",
+                colour=COLOUR,
+            )
+            embed.set_footer(text=self._info_footer)
+            self._info_embed = embed
+        await ctx.send(embed=self._info_embed)
 
 
 async def setup(bot: Bot) -> None:
@@ -9,14 +9,16 @@ import asyncio
 import heapq
 import logging
 import re
+import time
 import warnings
 from dataclasses import dataclass
-from math import ceil
 from secrets import token_hex
-from typing import TYPE_CHECKING, NamedTuple, Type, Literal, cast, TypeAlias, Any
+from typing import TYPE_CHECKING, NamedTuple, Literal, cast, TypeAlias, Any
 
 import aiosqlite
 import arrow
+import dateparser as dp_parser
+from dateutil import parser as du_parser
 from packaging import version
 
 import discord
@@ -31,10 +33,40 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-DB_VERSION = 1
+DB_VERSION = 3
 TIME_PARSE_METHOD: Literal["dateparser"] | Literal["dateutil"] = "dateparser"  # options: 'dateutil', 'dateparser'
 MessageableGuildChannel: TypeAlias = discord.TextChannel | discord.VoiceChannel | discord.Thread
 
+# Matches @everyone, @here and raw user/role mentions, compiled once at import
+MENTION_RE = re.compile(r"@(everyone|here|[!&]?[0-9]{17,20})", re.ASCII)
+
+# Scheduler columns in SavedScheduleEvent field order; queries select these
+# explicitly so from_row never depends on the table's physical column order
+SCHEDULER_COLUMNS = "id, message, guild_id, channel_id, author_id, next_event_time, repeat, canceled, mention"
+
+
+# Shared AllowedMentions instances, so each delivery doesn't allocate one
+MENTIONS_ALL = discord.AllowedMentions.all()
+MENTIONS_NONE = discord.AllowedMentions.none()
+
+logger.info("Using SQLite version %s.", aiosqlite.sqlite_version)
+# Older SQLite versions don't support RETURNING; parse the versions once at import
+SQLITE_SUPPORTS_RETURNING = version.parse(aiosqlite.sqlite_version) >= version.parse("3.35.0")
+
+# Reused parser settings for the common case where the user leaves the
+# timezone field at its default
+DEFAULT_PARSE_SETTINGS = {
+    "TIMEZONE": DEFAULT_TIMEZONE,
+    "RETURN_AS_TIMEZONE_AWARE": True,
+    "DEFAULT_LANGUAGES": TIME_LANG,
+}
+# Shared parser instance for default-timezone submissions; dateparser's
+# module-level parse() rebuilds its parser chain on every call
+DEFAULT_DATE_PARSER = dp_parser.DateDataParser(  # type: ignore[reportGeneralTypeIssues]
+    languages=TIME_LANG,
+    settings=DEFAULT_PARSE_SETTINGS,
+)
+
 
 class RawScheduleModalValues(NamedTuple):
     """
@@ -99,27 +131,6 @@ class ScheduleEvent(NamedTuple):
         """
         return cls(event.author, event.channel, event.message, event.time, event.repeat, mention)
 
-    @classmethod
-    def from_saved(
-        cls, event: SavedScheduleEvent, author: discord.Member, channel: MessageableGuildChannel
-    ) -> ScheduleEvent:
-        """
-        Converts a SanitizedScheduleEvent to ScheduleEvent by populating additional data.
-
-        :param event: The sanitized event.
-        :param author: The author of the event.
-        :param channel: The channel of the event.
-        :return: The converted ScheduleEvent.
-        """
-        return cls(
-            author,
-            channel,
-            event.message,
-            arrow.get(event.next_event_time),
-            float(event.repeat) if event.repeat is not None else None,
-            event.mention,
-        )
-
 
 class SavedScheduleEvent(NamedTuple):
     """
@@ -142,7 +153,9 @@ class SavedScheduleEvent(NamedTuple):
 
         :return: The stripped StrippedSavedScheduleEvent.
         """
-        return StrippedSavedScheduleEvent(self.id, self.next_event_time, self.repeat)
+        return StrippedSavedScheduleEvent(
+            self.id, self.channel_id, self.next_event_time, None if self.repeat is None else int(self.repeat * 60)
+        )
 
     @classmethod
     def from_row(cls, row: aiosqlite.Row) -> SavedScheduleEvent:
@@ -165,11 +178,15 @@ class SavedScheduleEvent(NamedTuple):
 class StrippedSavedScheduleEvent:
     """
     Represents a single (stripped down) scheduled message event in DB format. Used for caching.
+
+    The repeat interval is held in whole seconds (the DB stores minutes), so
+    each repeat iteration is a plain integer add.
     """
 
     id: int
+    channel_id: int
     next_event_time: int
-    repeat: float | int | None
+    repeat_seconds: int | None
 
     @classmethod
     def from_row(cls, row: aiosqlite.Row) -> StrippedSavedScheduleEvent:
@@ -179,7 +196,8 @@ class StrippedSavedScheduleEvent:
         :param row: The row fetched from the database.
         :return: Created StrippedSavedScheduleEvent.
         """
-        return cls(*row)
+        event_id, channel_id, next_event_time, repeat = row
+        return cls(event_id, channel_id, next_event_time, None if repeat is None else int(repeat * 60))
 
     def do_repeat(self, current_timestamp: int) -> StrippedSavedScheduleEvent:
         """
@@ -187,17 +205,11 @@ class StrippedSavedScheduleEvent:
 
         :return: New StrippedSavedScheduleEvent with updated next_event_time.
         """
-        if self.repeat is None:
+        if self.repeat_seconds is None:
             raise ValueError("repeat cannot be None to do_repeat().")
-        self.next_event_time = int(current_timestamp + self.repeat * 60)
+        self.next_event_time = current_timestamp + self.repeat_seconds
         return self
 
-    def __lt__(self, other: StrippedSavedScheduleEvent) -> bool:  # type: ignore[reportIncompatibleMethodOverride]
-        """
-        Use next_event_time as the comp.
-        """
-        return self.next_event_time < other.next_event_time
-
 
 class ScheduleError(ValueError):
     """
@@ -272,48 +284,6 @@ class BadTimeString(ScheduleError):
         self.time = time
 
 
-if TYPE_CHECKING:  # TODO: find another way to fix type checking
-    # Provides a stub for ScheduleModal, this will not run at runtime
-    class ScheduleModal(discord.ui.Modal, title="Schedule Creator"):
-        message: discord.ui.TextInput[ScheduleModal]
-        time: discord.ui.TextInput[ScheduleModal]
-        timezone: discord.ui.TextInput[ScheduleModal]
-        repeat: discord.ui.TextInput[ScheduleModal]
-
-        def __init__(self, scheduler: Scheduler, channel: MessageableGuildChannel) -> None:
-            self.scheduler = scheduler
-            self.channel = channel
-            super().__init__()
-
-        def sanitize_response(self, interaction: discord.Interaction) -> SanitizedScheduleEvent:
-            ...
-
-        @property
-        def acceptable_formats(self) -> list[str]:
-            return []
-
-        async def on_submit(self, interaction: discord.Interaction) -> None:
-            ...
-
-    class ScheduleEditModal(discord.ui.Modal, title="Schedule Editor"):
-        message: discord.ui.TextInput[ScheduleModal]
-        repeat: discord.ui.TextInput[ScheduleModal]
-
-        def __init__(
-            self, scheduler: Scheduler, channel: MessageableGuildChannel, original_event: SavedScheduleEvent
-        ) -> None:
-            self.scheduler = scheduler
-            self.channel = channel
-            self.original_event = original_event
-            super().__init__()
-
-        def sanitize_response(self, interaction: discord.Interaction) -> SanitizedScheduleEvent:
-            ...
-
-        async def on_submit(self, interaction: discord.Interaction) -> None:
-            ...
-
-
 def _parse_repeat(raw_repeat: str | None) -> float | None:
     """
     Validate the repeat for both schedule modals.
@@ -343,103 +313,102 @@ def _parse_repeat(raw_repeat: str | None) -> float | None:
     return repeat
 
 
-def get_schedule_modal(defaults: RawScheduleModalValues | None = None) -> Type[ScheduleModal]:
+class ScheduleModal(discord.ui.Modal, title="Schedule Creator"):
     """
-    This is a class factory to create ScheduleModal with defaults.
-
-    :param defaults: A RawScheduleModalValues object that will be used to populate default fields.
-    :return: A class ScheduleModal with defaults.
+    The scheduling modal to collect info for the schedule.
     """
-    message_default = cast(str | None, defaults and defaults.message)
-    time_default = cast(str | None, defaults and defaults.time)
-    timezone_default = cast(str, defaults and defaults.timezone or DEFAULT_TIMEZONE)
-    repeat_default = cast(str, defaults and defaults.repeat or "0")
 
-    # noinspection PyShadowingNames
-    class ScheduleModal(discord.ui.Modal, title="Schedule Creator"):
+    message: discord.ui.TextInput[ScheduleModal] = discord.ui.TextInput(
+        label="Message",
+        style=discord.TextStyle.paragraph,
+        required=True,
+        max_length=1000,
+    )
+    time: discord.ui.TextInput[ScheduleModal] = discord.ui.TextInput(
+        label="Scheduled Time (MM/DD/YY HH:MM:SS)", required=True, max_length=100
+    )
+    timezone: discord.ui.TextInput[ScheduleModal] = discord.ui.TextInput(
+        label="Timezone (UTC offset +/-HH:MM)", required=False, max_length=100, default=DEFAULT_TIMEZONE
+    )
+    repeat: discord.ui.TextInput[ScheduleModal] = discord.ui.TextInput(
+        label="Repeat every n minutes (0 to disable, min 60)",
+        required=False,
+        max_length=10,
+        default="0",
+    )
+
+    def __init__(
+        self,
+        scheduler: Scheduler,
+        channel: MessageableGuildChannel,
+        defaults: RawScheduleModalValues | None = None,
+    ) -> None:
         """
-        The scheduling modal to collect info for the schedule.
+        :param scheduler: The Scheduler object.
+        :param channel: The MessageableGuildChannel for the scheduled message.
+        :param defaults: A RawScheduleModalValues object that will be used to populate default fields.
         """
+        self.scheduler = scheduler
+        self.channel = channel
+        super().__init__()
+        if defaults is not None:
+            # super().__init__() deep-copies the class-level inputs onto this
+            # instance, so these defaults only affect this modal
+            self.message.default = defaults.message
+            self.time.default = defaults.time
+            if defaults.timezone:
+                self.timezone.default = defaults.timezone
+            if defaults.repeat:
+                self.repeat.default = defaults.repeat
 
-        message: discord.ui.TextInput[ScheduleModal] = discord.ui.TextInput(
-            label="Message",
-            style=discord.TextStyle.paragraph,
-            required=True,
-            max_length=1000,
-            default=message_default,
-        )
-        time: discord.ui.TextInput[ScheduleModal] = discord.ui.TextInput(
-            label="Scheduled Time (MM/DD/YY HH:MM:SS)", required=True, max_length=100, default=time_default
-        )
-        timezone: discord.ui.TextInput[ScheduleModal] = discord.ui.TextInput(
-            label="Timezone (UTC offset +/-HH:MM)", required=False, max_length=100, default=timezone_default
-        )
-        repeat: discord.ui.TextInput[ScheduleModal] = discord.ui.TextInput(
-            label="Repeat every n minutes (0 to disable, min 60)",
-            required=False,
-            max_length=10,
-            default=repeat_default,
-        )
-
-        def __init__(self, scheduler: Scheduler, channel: MessageableGuildChannel) -> None:
-            """
-            :param scheduler: The Scheduler object.
-            :param channel: The MessageableGuildChannel for the scheduled message.
-            """
-            self.scheduler = scheduler
-            self.channel = channel
-            super().__init__()
-
-        def sanitize_response(self, interaction: discord.Interaction) -> SanitizedScheduleEvent:
-            """
-            Sanitize the modal entries and raise appropriate errors.
-
-            :param interaction: The interaction context.
-            :raises ParseError: If the time cannot be understood.
-            :raises TimeInPast: If the time is in the past.
-            :raises UnknownTimezoneWarning: If the timezone is provided in the time.
-            :raises InvalidRepeat: If repeat is longer than a year or shorter than an hour.
-            :return: The sanitized ScheduleEvent.
-            """
+    def sanitize_response(self, interaction: discord.Interaction) -> SanitizedScheduleEvent:
+        """
+        Sanitize the modal entries and raise appropriate errors.
 
-            logger.debug("Sanitizing schedule event.")
-            if self.time.value is None or self.message.value is None:
-                raise ValueError("time and message cannot be None here since they are non-optional.")
+        :param interaction: The interaction context.
+        :raises ParseError: If the time cannot be understood.
+        :raises TimeInPast: If the time is in the past.
+        :raises UnknownTimezoneWarning: If the timezone is provided in the time.
+        :raises InvalidRepeat: If repeat is longer than a year or shorter than an hour.
+        :return: The sanitized ScheduleEvent.
+        """
 
-            if not isinstance(interaction.user, discord.Member):
-                raise ValueError("interaction.user must be a Member (cannot be ran from DM).")
+        logger.debug("Sanitizing schedule event.")
+        if self.time.value is None or self.message.value is None:
+            raise ValueError("time and message cannot be None here since they are non-optional.")
 
-            if TIME_PARSE_METHOD == "dateutil":
-                from dateutil import parser as du_parser
+        if not isinstance(interaction.user, discord.Member):
+            raise ValueError("interaction.user must be a Member (cannot be ran from DM).")
 
+        if TIME_PARSE_METHOD == "dateutil":
+            try:
+                # parse the time
+                with warnings.catch_warnings():  # will raise exception is an unknown timezone is detected
+                    # noinspection PyUnresolvedReferences
+                    warnings.simplefilter(
+                        "error", du_parser.UnknownTimezoneWarning  # type: ignore[reportGeneralTypeIssues]
+                    )  # exists, but editor is weird
+                    naive_time = du_parser.parse(self.time.value)
+            except du_parser.UnknownTimezoneWarning as e:  # type: ignore[reportGeneralTypeIssues]
+                raise BadTimezone(None) from e
+            except du_parser.ParserError as e:  # fails to parse time
+                raise BadTimeString(self.time.value) from e
+
+            # apply the timezone
+            if self.timezone.value:  # if user inputted a timezone
                 try:
-                    # parse the time
-                    with warnings.catch_warnings():  # will raise exception is an unknown timezone is detected
-                        # noinspection PyUnresolvedReferences
-                        warnings.simplefilter(
-                            "error", du_parser.UnknownTimezoneWarning  # type: ignore[reportGeneralTypeIssues]
-                        )  # exists, but editor is weird
-                        naive_time = du_parser.parse(self.time.value)
-                except du_parser.UnknownTimezoneWarning as e:  # type: ignore[reportGeneralTypeIssues]
-                    raise BadTimezone(None) from e
-                except du_parser.ParserError as e:  # fails to parse time
-                    raise BadTimeString(self.time.value) from e
-
-                # apply the timezone
-                if self.timezone.value:  # if user inputted a timezone
-                    try:
-                        time = arrow.get(naive_time, self.timezone.value)
-                    except arrow.ParserError as e:  # fails to parse timezone
-                        logger.debug("Failed to parse timezone.", exc_info=e)
-                        raise BadTimezone(self.timezone.value) from e
-                else:
-                    time = arrow.get(naive_time)  # will use either tz from naive time or UTC
-                del du_parser  # remove local variable
-
-            else:  # dateparser method
-                import dateparser as dp_parser
+                    time = arrow.get(naive_time, self.timezone.value)
+                except arrow.ParserError as e:  # fails to parse timezone
+                    logger.debug("Failed to parse timezone.", exc_info=e)
+                    raise BadTimezone(self.timezone.value) from e
+            else:
+                time = arrow.get(naive_time)  # will use either tz from naive time or UTC
 
-                try:
+        else:  # dateparser method
+            try:
+                if self.timezone.value == DEFAULT_TIMEZONE:
+                    naive_time = DEFAULT_DATE_PARSER.get_date_data(self.time.value).date_obj
+                else:
                     naive_time = dp_parser.parse(
                         self.time.value,
                         languages=TIME_LANG,
@@ -449,309 +418,303 @@ def get_schedule_modal(defaults: RawScheduleModalValues | None = None) -> Type[S
                             "DEFAULT_LANGUAGES": TIME_LANG,
                         },  # type: ignore[reportGeneralTypeIssues]
                     )
-                except Exception as e:
-                    if e.__class__.__name__ == "UnknownTimeZoneError":  # invalid timezone
-                        raise BadTimezone(self.timezone.value) from e
-                    raise  # re-raise
-
-                if naive_time is None:
-                    raise BadTimeString(self.time.value)
-                time = arrow.get(naive_time)
-                del dp_parser  # remove local variable
-
-            # check time is in the future
-            now = arrow.utcnow()
-            if time <= now:
-                logger.debug("Time is in the past. Time: %s, now: %s", time, now)
-                raise TimeInPast(time)
-
-            repeat = _parse_repeat(self.repeat.value)
-            return SanitizedScheduleEvent(interaction.user, self.channel, self.message.value, time, repeat)
-
-        @property
-        def acceptable_formats(self) -> list[str]:
-            """
-            :return: A list of acceptable time formats.
-            """
-            if TIME_PARSE_METHOD == "dateutil":
-                return [
-                    "- 1/30/2023 3:20am",
-                    "- Jan 30 2023 3:20",
-                    "- 2023-Jan-30 3h20m",
-                    "- January 30th, 2023 at 03:20:00",
-                ]
-            else:
-                return [
-                    "- Just date: `2/24/2023` (Month/Day/Year), `December 12`, `nov 26 2023`",
-                    "- Just time: `1:12am`, `midnight`, `13:42`, `7pm`",
-                    "- Date and time: `02/24/23 19:31:03`",
-                    "- Other date formats: `March 30 2023 4:10pm`",
-                    "- Simple time: `tomorrow`, `next week`, `thursday at noon`",
-                    "- Slightly complicated relative time: `in 1 day, 2 hours and 10 minutes`",
-                    "- ISO 8601 format: `2023-08-11T01:59:41.981897`",
-                ]
-
-        async def on_submit(self, interaction: discord.Interaction) -> None:
-            """
-            Callback for modal submission.
-            """
-            try:
-                event = self.sanitize_response(interaction)
-            except BadTimezone as e:
-                logger.debug("Bad timezone: %s.", e.timezone, exc_info=e)
-                if e.timezone is None:
-                    # Invalid timezone in dateutil.parser.parse
-                    embed = discord.Embed(
-                        description="Please don't include timezones in the **Scheduled Time** field.",
-                        colour=COLOUR,
-                    )
-                else:
-                    embed = discord.Embed(
-                        description="I cannot understand this timezone. Try entering the "
-                        "[TZ database name](https://en.wikipedia.org/wiki/List_of_tz_database_time_zones) "
-                        "of your timezone (case sensitive).",
-                        colour=COLOUR,
-                    )
-            except TimeInPast as e:  # time is in the past
-                logger.debug("Bad time: %s.", e.time, exc_info=e)
-                timestamp = int(e.time.timestamp())
+            except Exception as e:
+                if e.__class__.__name__ == "UnknownTimeZoneError":  # invalid timezone
+                    raise BadTimezone(self.timezone.value) from e
+                raise  # re-raise
+
+            if naive_time is None:
+                raise BadTimeString(self.time.value)
+            time = arrow.get(naive_time)
+
+        # check time is in the future
+        now = arrow.utcnow()
+        if time <= now:
+            logger.debug("Time is in the past. Time: %s, now: %s", time, now)
+            raise TimeInPast(time)
+
+        repeat = _parse_repeat(self.repeat.value)
+        return SanitizedScheduleEvent(interaction.user, self.channel, self.message.value, time, repeat)
+
+    @property
+    def acceptable_formats(self) -> list[str]:
+        """
+        :return: A list of acceptable time formats.
+        """
+        if TIME_PARSE_METHOD == "dateutil":
+            return [
+                "- 1/30/2023 3:20am",
+                "- Jan 30 2023 3:20",
+                "- 2023-Jan-30 3h20m",
+                "- January 30th, 2023 at 03:20:00",
+            ]
+        else:
+            return [
+                "- Just date: `2/24/2023` (Month/Day/Year), `December 12`, `nov 26 2023`",
+                "- Just time: `1:12am`, `midnight`, `13:42`, `7pm`",
+                "- Date and time: `02/24/23 19:31:03`",
+                "- Other date formats: `March 30 2023 4:10pm`",
+                "- Simple time: `tomorrow`, `next week`, `thursday at noon`",
+                "- Slightly complicated relative time: `in 1 day, 2 hours and 10 minutes`",
+                "- ISO 8601 format: `2023-08-11T01:59:41.981897`",
+            ]
+
+    async def on_submit(self, interaction: discord.Interaction) -> None:
+        """
+        Callback for modal submission.
+        """
+        try:
+            event = self.sanitize_response(interaction)
+        except BadTimezone as e:
+            logger.debug("Bad timezone: %s.", e.timezone, exc_info=e)
+            if e.timezone is None:
+                # Invalid timezone in dateutil.parser.parse
                 embed = discord.Embed(
-                    description=f"The time you inputted is **in the past** <t:{timestamp}> (<t:{timestamp}:R>). "
-                    f"Double check the time is valid or try one of the formats below.",
+                    description="Please don't include timezones in the **Scheduled Time** field.",
                     colour=COLOUR,
                 )
-                embed.add_field(
-                    name="Valid time formats:", value="\n".join(self.acceptable_formats) + "\n- And More..."
-                )
-            except InvalidRepeat as e:  # repeat is invalid
-                logger.debug("Bad repeat %s.", self.repeat, exc_info=e)
-                embed = discord.Embed(description=e.reason, colour=COLOUR)
-            except BadTimeString as e:  # time parse error
+            else:
                 embed = discord.Embed(
-                    description=f"I cannot understand the time **{discord.utils.escape_markdown(e.time)}**.",
+                    description="I cannot understand this timezone. Try entering the "
+                    "[TZ database name](https://en.wikipedia.org/wiki/List_of_tz_database_time_zones) "
+                    "of your timezone (case sensitive).",
                     colour=COLOUR,
                 )
-                embed.add_field(
-                    name="Valid time formats:", value="\n".join(self.acceptable_formats) + "\n- And More..."
-                )
-            else:
-                # Check if the message contains a mention and both author
-                mentions = re.search(r"@(everyone|here|[!&]?[0-9]{17,20})", event.message)
-
-                if mentions is not None:
-                    logger.debug("Event has mention.")
-                    perms_author = self.channel.permissions_for(event.author)
-                    perms_bot = self.channel.permissions_for(self.channel.guild.me)
-
-                    # This is a privileged mention (@everyone, @here, @role)
-                    if mentions.group(1) in {"everyone", "here"} or mentions.group(1).startswith("&"):
-                        # Bot will need permissions to ping as well
-                        check = perms_author.mention_everyone and perms_bot.mention_everyone
-                        logger.debug(
-                            "Checking all mentions, author: %s bot: %s.",
-                            perms_author.mention_everyone,
-                            perms_bot.mention_everyone,
-                        )
-                    else:
-                        check = perms_author.mention_everyone
-                        logger.debug("Checking all mentions, author: %s.", perms_author.mention_everyone)
-
-                    if check:  # if pinging is a possibility
-                        logger.info("Sending mention approval form.")
-
-                        embed = discord.Embed(
-                            title="This scheduled message contains mentions",
-                            description="Click **Yes** if the mentions should ping "
-                            "its members, otherwise click **No**.\n\n"
-                            "Alternatively, click **Edit** to revise your message.",
-                            colour=COLOUR,
-                        )
-                        embed.add_field(name="Message", value=event.message, inline=False)
-                        await interaction.response.send_message(
-                            embed=embed,
-                            view=ScheduleMentionView(
-                                self.scheduler,
-                                interaction.user,
-                                self.channel,
-                                event,
-                                RawScheduleModalValues.from_modal(self),
-                            ),
-                            ephemeral=True,
-                        )
-                        return
-
-                logger.info("Saving event: no mention or no perms.")
-                # Message has no mentions, or the bot or user cannot mention in this channel,
-                # so don't bother asking
-                await self.scheduler.save_event(interaction, ScheduleEvent.from_sanitized(event, False))
-                return
-
-            logger.info("Failed to save, sending edit form.")
-            # If failed
-            embed.set_footer(text='Click the "Edit" button below to edit your form.')
-            await interaction.response.send_message(
-                embed=embed,
-                view=ScheduleEditView(
-                    self.scheduler, interaction.user, self.channel, RawScheduleModalValues.from_modal(self)
-                ),
-                ephemeral=True,
+        except TimeInPast as e:  # time is in the past
+            logger.debug("Bad time: %s.", e.time, exc_info=e)
+            timestamp = e.time.int_timestamp
+            embed = discord.Embed(
+                description=f"The time you inputted is **in the past** <t:{timestamp}> (<t:{timestamp}:R>). "
+                f"Double check the time is valid or try one of the formats below.",
+                colour=COLOUR,
+            )
+            embed.add_field(
+                name="Valid time formats:", value="\n".join(self.acceptable_formats) + "\n- And More..."
+            )
+        except InvalidRepeat as e:  # repeat is invalid
+            logger.debug("Bad repeat %s.", self.repeat, exc_info=e)
+            embed = discord.Embed(description=e.reason, colour=COLOUR)
+        except BadTimeString as e:  # time parse error
+            embed = discord.Embed(
+                description=f"I cannot understand the time **{discord.utils.escape_markdown(e.time)}**.",
+                colour=COLOUR,
             )
+            embed.add_field(
+                name="Valid time formats:", value="\n".join(self.acceptable_formats) + "\n- And More..."
+            )
+        else:
+            # Check if the message contains a mention and both author
+            # (cheap substring test first: most messages have no @ at all)
+            mentions = MENTION_RE.search(event.message) if "@" in event.message else None
+
+            if mentions is not None:
+                logger.debug("Event has mention.")
+                perms_author = self.channel.permissions_for(event.author)
+                perms_bot = self.channel.permissions_for(self.channel.guild.me)
+
+                # This is a privileged mention (@everyone, @here, @role)
+                group = mentions.group(1)
+                if group == "everyone" or group == "here" or group.startswith("&"):
+                    # Bot will need permissions to ping as well
+                    check = perms_author.mention_everyone and perms_bot.mention_everyone
+                    logger.debug(
+                        "Checking all mentions, author: %s bot: %s.",
+                        perms_author.mention_everyone,
+                        perms_bot.mention_everyone,
+                    )
+                else:
+                    check = perms_author.mention_everyone
+                    logger.debug("Checking all mentions, author: %s.", perms_author.mention_everyone)
+
+                if check:  # if pinging is a possibility
+                    logger.info("Sending mention approval form.")
 
-    return ScheduleModal
+                    embed = discord.Embed(
+                        title="This scheduled message contains mentions",
+                        description="Click **Yes** if the mentions should ping "
+                        "its members, otherwise click **No**.\n\n"
+                        "Alternatively, click **Edit** to revise your message.",
+                        colour=COLOUR,
+                    )
+                    embed.add_field(name="Message", value=event.message, inline=False)
+                    await interaction.response.send_message(
+                        embed=embed,
+                        view=ScheduleMentionView(
+                            self.scheduler,
+                            interaction.user,
+                            self.channel,
+                            event,
+                            RawScheduleModalValues.from_modal(self),
+                        ),
+                        ephemeral=True,
+                    )
+                    return
 
+            logger.info("Saving event: no mention or no perms.")
+            # Message has no mentions, or the bot or user cannot mention in this channel,
+            # so don't bother asking
+            await self.scheduler.save_event(interaction, ScheduleEvent.from_sanitized(event, False))
+            return
 
-# The empty ScheduleModal with no defaults
-ScheduleModal = get_schedule_modal()
+        logger.info("Failed to save, sending edit form.")
+        # If failed
+        embed.set_footer(text='Click the "Edit" button below to edit your form.')
+        await interaction.response.send_message(
+            embed=embed,
+            view=ScheduleEditView(
+                self.scheduler, interaction.user, self.channel, RawScheduleModalValues.from_modal(self)
+            ),
+            ephemeral=True,
+        )
 
 
-def get_schedule_edit_modal(defaults: RawScheduleModalValues | None = None) -> Type[ScheduleEditModal]:
+class ScheduleEditModal(discord.ui.Modal, title="Schedule Editor"):
     """
-    This is a class factory to create ScheduleEditModal with defaults.
-
-    :param defaults: A RawScheduleModalValues object that will be used to populate default fields.
-    :return: A class ScheduleEditModal with defaults.
+    The scheduling modal to collect info for editing the schedule.
     """
-    message_default = cast(str | None, defaults and defaults.message)
-    repeat_default = cast(str, defaults and defaults.repeat or "0")
 
-    # noinspection PyShadowingNames
-    class ScheduleEditModal(discord.ui.Modal, title="Schedule Editor"):
+    message: discord.ui.TextInput[ScheduleModal] = discord.ui.TextInput(
+        label="Message",
+        style=discord.TextStyle.paragraph,
+        required=True,
+        max_length=1000,
+    )
+    repeat: discord.ui.TextInput[ScheduleModal] = discord.ui.TextInput(
+        label="Repeat every n minutes (0 to disable, min 60)",
+        required=False,
+        max_length=10,
+        default="0",
+    )
+
+    def __init__(
+        self,
+        scheduler: Scheduler,
+        channel: MessageableGuildChannel,
+        original_event: SavedScheduleEvent,
+        defaults: RawScheduleModalValues | None = None,
+    ) -> None:
         """
-        The scheduling modal to collect info for editing the schedule.
+        :param scheduler: The Scheduler object.
+        :param channel: The MessageableGuildChannel for the scheduled message.
+        :param original_event: The current event before the edit.
+        :param defaults: A RawScheduleModalValues object that will be used to populate default fields.
         """
+        self.scheduler = scheduler
+        self.channel = channel
+        self.original_event = original_event
+        super().__init__()
+        if defaults is not None:
+            # super().__init__() deep-copies the class-level inputs onto this
+            # instance, so these defaults only affect this modal
+            self.message.default = defaults.message
+            if defaults.repeat:
+                self.repeat.default = defaults.repeat
 
-        message: discord.ui.TextInput[ScheduleModal] = discord.ui.TextInput(
-            label="Message",
-            style=discord.TextStyle.paragraph,
-            required=True,
-            max_length=1000,
-            default=message_default,
-        )
-        repeat: discord.ui.TextInput[ScheduleModal] = discord.ui.TextInput(
-            label="Repeat every n minutes (0 to disable, min 60)",
-            required=False,
-            max_length=10,
-            default=repeat_default,
-        )
+    def sanitize_response(self, interaction: discord.Interaction) -> SanitizedScheduleEvent:
+        """
+        Sanitize the modal entries and raise appropriate errors.
 
-        def __init__(
-            self, scheduler: Scheduler, channel: MessageableGuildChannel, original_event: SavedScheduleEvent
-        ) -> None:
-            """
-            :param scheduler: The Scheduler object.
-            :param channel: The MessageableGuildChannel for the scheduled message.
-            :param original_event: The current event before the edit.
-            """
-            self.scheduler = scheduler
-            self.channel = channel
-            self.original_event = original_event
-            super().__init__()
+        :param interaction: The interaction context.
+        :raises InvalidRepeat: If repeat is longer than a year or shorter than an hour.
+        :return: The sanitized ScheduleEvent.
+        """
 
-        def sanitize_response(self, interaction: discord.Interaction) -> SanitizedScheduleEvent:
-            """
-            Sanitize the modal entries and raise appropriate errors.
+        logger.debug("Sanitizing schedule edit event.")
+        if self.message.value is None:
+            raise ValueError("Message cannot be None here since they are non-optional.")
 
-            :param interaction: The interaction context.
-            :raises InvalidRepeat: If repeat is longer than a year or shorter than an hour.
-            :return: The sanitized ScheduleEvent.
-            """
+        if not isinstance(interaction.user, discord.Member):
+            raise ValueError("interaction.user must be a Member (cannot be ran from DM).")
 
-            logger.debug("Sanitizing schedule edit event.")
-            if self.message.value is None:
-                raise ValueError("Message cannot be None here since they are non-optional.")
+        repeat = _parse_repeat(self.repeat.value)
+        return SanitizedScheduleEvent(
+            interaction.user,
+            self.channel,
+            self.message.value,
+            arrow.get(self.original_event.next_event_time),
+            repeat,
+        )
 
-            if not isinstance(interaction.user, discord.Member):
-                raise ValueError("interaction.user must be a Member (cannot be ran from DM).")
+    async def on_submit(self, interaction: discord.Interaction) -> None:
+        """
+        Callback for modal submission.
+        """
+        try:
+            event = self.sanitize_response(interaction)
+        except InvalidRepeat as e:  # repeat is invalid
+            logger.debug("Bad repeat %s.", self.repeat, exc_info=e)
+            embed = discord.Embed(description=e.reason, colour=COLOUR)
+        else:
+            # Check if the message contains a mention and both author
+            # (cheap substring test first: most messages have no @ at all)
+            mentions = MENTION_RE.search(event.message) if "@" in event.message else None
+
+            if mentions is not None:
+                logger.debug("Event has mention.")
+                perms_author = self.channel.permissions_for(event.author)
+                perms_bot = self.channel.permissions_for(self.channel.guild.me)
+
+                # This is a privileged mention (@everyone, @here, @role)
+                group = mentions.group(1)
+                if group == "everyone" or group == "here" or group.startswith("&"):
+                    # Bot will need permissions to ping as well
+                    check = perms_author.mention_everyone and perms_bot.mention_everyone
+                    logger.debug(
+                        "Checking all mentions, author: %s bot: %s.",
+                        perms_author.mention_everyone,
+                        perms_bot.mention_everyone,
+                    )
+                else:
+                    check = perms_author.mention_everyone
+                    logger.debug("Checking all mentions, author: %s.", perms_author.mention_everyone)
 
-            repeat = _parse_repeat(self.repeat.value)
-            return SanitizedScheduleEvent(
-                interaction.user,
-                self.channel,
-                self.message.value,
-                arrow.get(self.original_event.next_event_time),
-                repeat,
-            )
+                if check:  # if pinging is a possibility
+                    logger.info("Sending mention approval form.")
 
-        async def on_submit(self, interaction: discord.Interaction) -> None:
-            """
-            Callback for modal submission.
-            """
-            try:
-                event = self.sanitize_response(interaction)
-            except InvalidRepeat as e:  # repeat is invalid
-                logger.debug("Bad repeat %s.", self.repeat, exc_info=e)
-                embed = discord.Embed(description=e.reason, colour=COLOUR)
-            else:
-                # Check if the message contains a mention and both author
-                mentions = re.search(r"@(everyone|here|[!&]?[0-9]{17,20})", event.message)
-
-                if mentions is not None:
-                    logger.debug("Event has mention.")
-                    perms_author = self.channel.permissions_for(event.author)
-                    perms_bot = self.channel.permissions_for(self.channel.guild.me)
-
-                    # This is a privileged mention (@everyone, @here, @role)
-                    if mentions.group(1) in {"everyone", "here"} or mentions.group(1).startswith("&"):
-                        # Bot will need permissions to ping as well
-                        check = perms_author.mention_everyone and perms_bot.mention_everyone
-                        logger.debug(
-                            "Checking all mentions, author: %s bot: %s.",
-                            perms_author.mention_everyone,
-                            perms_bot.mention_everyone,
-                        )
-                    else:
-                        check = perms_author.mention_everyone
-                        logger.debug("Checking all mentions, author: %s.", perms_author.mention_everyone)
-
-                    if check:  # if pinging is a possibility
-                        logger.info("Sending mention approval form.")
-
-                        embed = discord.Embed(
-                            title="This scheduled message contains mentions",
-                            description="Click **Yes** if the mentions should ping "
-                            "its members, otherwise click **No**.\n\n"
-                            "Alternatively, click **Edit** to revise your message.",
-                            colour=COLOUR,
-                        )
-                        embed.add_field(name="Message", value=event.message, inline=False)
-                        await interaction.response.send_message(
-                            embed=embed,
-                            view=ScheduleMentionView(
-                                self.scheduler,
-                                interaction.user,
-                                self.channel,
-                                event,
-                                RawScheduleModalValues.from_edit_modal(self),
-                                original_event=self.original_event,
-                            ),
-                            ephemeral=True,
-                        )
-                        return
-
-                logger.info("Saving event: no mention or no perms.")
-                # Message has no mentions, or the bot or user cannot mention in this channel,
-                # so don't bother asking
-                await self.scheduler.save_event(
-                    interaction, ScheduleEvent.from_sanitized(event, False), original_event=self.original_event
-                )
-                return
+                    embed = discord.Embed(
+                        title="This scheduled message contains mentions",
+                        description="Click **Yes** if the mentions should ping "
+                        "its members, otherwise click **No**.\n\n"
+                        "Alternatively, click **Edit** to revise your message.",
+                        colour=COLOUR,
+                    )
+                    embed.add_field(name="Message", value=event.message, inline=False)
+                    await interaction.response.send_message(
+                        embed=embed,
+                        view=ScheduleMentionView(
+                            self.scheduler,
+                            interaction.user,
+                            self.channel,
+                            event,
+                            RawScheduleModalValues.from_edit_modal(self),
+                            original_event=self.original_event,
+                        ),
+                        ephemeral=True,
+                    )
+                    return
 
-            logger.info("Failed to save, sending edit form.")
-            # If failed
-            embed.set_footer(text='Click the "Edit" button below to edit your form.')
-            await interaction.response.send_message(
-                embed=embed,
-                view=ScheduleEditView(
-                    self.scheduler,
-                    interaction.user,
-                    self.channel,
-                    RawScheduleModalValues.from_edit_modal(self),
-                    original_event=self.original_event,
-                ),
-                ephemeral=True,
+            logger.info("Saving event: no mention or no perms.")
+            # Message has no mentions, or the bot or user cannot mention in this channel,
+            # so don't bother asking
+            await self.scheduler.save_event(
+                interaction, ScheduleEvent.from_sanitized(event, False), original_event=self.original_event
             )
+            return
 
-    return ScheduleEditModal
+        logger.info("Failed to save, sending edit form.")
+        # If failed
+        embed.set_footer(text='Click the "Edit" button below to edit your form.')
+        await interaction.response.send_message(
+            embed=embed,
+            view=ScheduleEditView(
+                self.scheduler,
+                interaction.user,
+                self.channel,
+                RawScheduleModalValues.from_edit_modal(self),
+                original_event=self.original_event,
+            ),
+            ephemeral=True,
+        )
 
 
 class ScheduleView(discord.ui.View):
@@ -832,12 +795,12 @@ class ScheduleEditView(discord.ui.View):
         if self.original_event is None:
             logger.info("Creating a schedule modal from edit schedule view.")
             await interaction.response.send_modal(
-                get_schedule_modal(self.raw_values)(self.scheduler, self.channel)
+                ScheduleModal(self.scheduler, self.channel, defaults=self.raw_values)
             )
         else:
             logger.info("Creating a schedule edit modal from edit schedule view.")
             await interaction.response.send_modal(
-                get_schedule_edit_modal(self.raw_values)(self.scheduler, self.channel, self.original_event)
+                ScheduleEditModal(self.scheduler, self.channel, self.original_event, defaults=self.raw_values)
             )
         self.stop()
 
@@ -922,12 +885,12 @@ class ScheduleMentionView(discord.ui.View):
         if self.original_event is None:
             logger.info("Edit schedule modal from mention view.")
             await interaction.response.send_modal(
-                get_schedule_modal(self.raw_values)(self.scheduler, self.channel)
+                ScheduleModal(self.scheduler, self.channel, defaults=self.raw_values)
             )
         else:
             logger.info("Edit schedule edit modal from mention view.")
             await interaction.response.send_modal(
-                get_schedule_edit_modal(self.raw_values)(self.scheduler, self.channel, self.original_event)
+                ScheduleEditModal(self.scheduler, self.channel, self.original_event, defaults=self.raw_values)
             )
         self.stop()
 
@@ -954,15 +917,15 @@ class ScheduleListView(discord.ui.View):
         self.responded = False
 
         if self.channel is None:
-            self.raw_query = r"""
-                SELECT *
+            self.raw_query = rf"""
+                SELECT {SCHEDULER_COLUMNS}, count(*) OVER () AS total
                     FROM Scheduler
                     WHERE canceled=0
                         AND author_id=$author_id
                         AND guild_id=$guild_id
                     ORDER BY next_event_time
-                    LIMIT {limit}
-                    OFFSET {offset}
+                    LIMIT {{limit}}
+                    OFFSET {{offset}}
             """
             self.raw_count_query = r"""
                 SELECT count(*)
@@ -972,16 +935,16 @@ class ScheduleListView(discord.ui.View):
                         AND guild_id=$guild_id
             """
         else:
-            self.raw_query = r"""
-                SELECT *
+            self.raw_query = rf"""
+                SELECT {SCHEDULER_COLUMNS}, count(*) OVER () AS total
                     FROM Scheduler
                     WHERE canceled=0
                         AND author_id=$author_id
                         AND channel_id=$channel_id
                         AND guild_id=$guild_id
                     ORDER BY next_event_time
-                    LIMIT {limit}
-                    OFFSET {offset}
+                    LIMIT {{limit}}
+                    OFFSET {{offset}}
             """
             self.raw_count_query = r"""
                 SELECT count(*)
@@ -1011,16 +974,38 @@ class ScheduleListView(discord.ui.View):
             "guild_id": interaction.guild.id,
         }
 
-        # Get the total row count
-        async with self.scheduler.db.execute(self.raw_count_query, params) as cur:
-            row = await cur.fetchone()
+        start_index = self.current_page * self.LIMIT_PER_PAGE
 
-        if row is None:
-            raise ValueError("Something went wrong with the DB.")
-        total_count: int = row[0]
-        logger.debug("Found %d schedule events.", total_count)
+        async def fetch_page() -> tuple[list[SavedScheduleEvent], int]:
+            # Fetch a page; the count(*) window function delivers the total
+            # row count alongside each row, saving a separate count round-trip
+            logger.debug("Querying schedule from %d with limit of %d.", start_index, self.LIMIT_PER_PAGE)
+            async with self.scheduler.db_read.execute(
+                self.raw_query.format(limit=self.LIMIT_PER_PAGE, offset=start_index),
+                params,
+            ) as cur:
+                rows = list(await cur.fetchall())
+            total_count: int = rows[0][-1] if rows else 0  # the windowed total is the last column
+            schedules = [
+                SavedScheduleEvent.from_row(row[:-1]) for row in rows  # type: ignore[reportGeneralTypeIssues]
+            ]
+            return schedules, total_count
+
+        schedules, total_count = await fetch_page()
+
+        if not schedules and self.current_page > 0:
+            # The page is past the end (events were deleted since the last
+            # render), so the count is needed after all to clamp to last page
+            async with self.scheduler.db_read.execute(self.raw_count_query, params) as cur:
+                row = await cur.fetchone()
+            if row is None:
+                raise ValueError("Something went wrong with the DB.")
+            if row[0] > 0:
+                self.current_page = (row[0] - 1) // self.LIMIT_PER_PAGE  # get last page
+                start_index = self.current_page * self.LIMIT_PER_PAGE
+                schedules, total_count = await fetch_page()
 
-        if total_count == 0:  # no scheduled messages
+        if not schedules:  # no scheduled messages
             logger.debug("No schedules found.")
             if self.channel is None:
                 embed = discord.Embed(description="You have no scheduled messages.", colour=COLOUR)
@@ -1035,53 +1020,41 @@ class ScheduleListView(discord.ui.View):
                 await interaction.response.send_message(embed=embed)
             return
 
-        start_index = self.current_page * self.LIMIT_PER_PAGE
-        if start_index >= total_count:  # if the index is beyond the total count, goto last page
-            self.current_page = ceil(total_count / self.LIMIT_PER_PAGE) - 1  # get last page
-            start_index = self.current_page * self.LIMIT_PER_PAGE
-
-        logger.debug("Querying schedule from %d with limit of %d.", start_index, self.LIMIT_PER_PAGE)
-        # Populate schedules from database
-        schedules: list[SavedScheduleEvent] = []
-        async with self.scheduler.db.execute(
-            self.raw_query.format(limit=self.LIMIT_PER_PAGE, offset=start_index),
-            params,
-        ) as cur:
-            async for row in cur:
-                schedules += [SavedScheduleEvent.from_row(row)]
+        logger.debug("Found %d schedule events.", total_count)
 
         if self.channel is None:
             title = f"{author}'s Scheduled Messages"
         else:
             title = f"{author}'s Scheduled Messages in {self.channel}"
 
-        description = ""  # format the schedule description, limit 2000 character
+        parts: list[str] = []  # format the schedule description, limit 2000 character
         for schedule in schedules:
             timestamp = int(schedule.next_event_time)
-            description += f"**ID: {schedule.id}** <t:{timestamp}> (<t:{timestamp}:R>)"
+            parts += [f"**ID: {schedule.id}** <t:{timestamp}> (<t:{timestamp}:R>)"]
             if self.channel is None:
-                description += f" <#{schedule.channel_id}>"
+                parts += [f" <#{schedule.channel_id}>"]
 
             if schedule.repeat is not None:
                 repeat = float(schedule.repeat)
                 if repeat.is_integer():
-                    description += f" every {int(repeat)} minute{'s' if repeat != 1 else ''}"
+                    parts += [f" every {int(repeat)} minute{'s' if repeat != 1 else ''}"]
                 else:
-                    description += f" every {repeat:.2f} minute{'s' if repeat != 1 else ''}"
+                    parts += [f" every {repeat:.2f} minute{'s' if repeat != 1 else ''}"]
 
-            description += ":\n"
+            parts += [":\n"]
 
             text = discord.utils.escape_markdown(schedule.message.replace("\n", ""))
             if len(text) > 100:  # 100 characters of preview text, 2000 char limit / 10 per page - 100 meta text
                 text = text[: 100 - 3].rstrip() + "..."
-            description += f"> {text}\n\n"
+            parts += [f"> {text}\n\n"]
 
-        embed = discord.Embed(title=title, description=description, colour=COLOUR)
+        embed = discord.Embed(title=title, description="".join(parts), colour=COLOUR)
 
         kwargs: dict[str, Any] = {}
         if total_count > self.LIMIT_PER_PAGE:  # more than one page
             kwargs["view"] = self
-            embed.set_footer(text=f"Page {self.current_page + 1} of {ceil(total_count / self.LIMIT_PER_PAGE)}")
+            total_pages = (total_count + self.LIMIT_PER_PAGE - 1) // self.LIMIT_PER_PAGE
+            embed.set_footer(text=f"Page {self.current_page + 1} of {total_pages}")
 
         if self.responded:
             if isinstance(interaction, commands.Context):
@@ -1132,8 +1105,21 @@ class Scheduler(Cog):
     def __init__(self, bot: Bot) -> None:
         self.bot = bot
         self.db: aiosqlite.Connection = cast(aiosqlite.Connection, None)
-        self.schedule_heap: list[StrippedSavedScheduleEvent] = []
-        self.heap_lock = asyncio.Lock()
+        self.db_read: aiosqlite.Connection = cast(aiosqlite.Connection, None)
+        # Heap entries are (next_event_time, id, event) so heapq compares
+        # plain ints in C (the unique id breaks timestamp ties) instead of
+        # dispatching to a Python-level __lt__
+        # No lock guards the heap: every mutation is synchronous C code run
+        # between awaits on the single event-loop thread
+        self.schedule_heap: list[tuple[int, int, StrippedSavedScheduleEvent]] = []
+        # Events deleted in-process; lets the loop drop stale heap entries
+        # without a database round-trip
+        self._canceled_ids: set[int] = set()
+        # Set whenever a new event is pushed, to wake the sleeping loop in
+        # case the new event is due sooner than the old heap head
+        self._heap_updated = asyncio.Event()
+        # Bounds the fan-out of concurrent scheduled-message sends
+        self._dispatch_sem = asyncio.Semaphore(8)
 
     async def cog_load(self) -> None:
         """
@@ -1144,24 +1130,25 @@ class Scheduler(Cog):
         await self.init_db()
 
         logger.debug("Populating schedules.")
-        # Populate schedules from database
-        schedules: list[StrippedSavedScheduleEvent] = []
+        # Populate schedules from database, fetching all rows in one hop to
+        # the worker thread rather than one await per row
         async with self.db.execute(
             r"""
-            SELECT id, next_event_time, repeat
+            SELECT id, channel_id, next_event_time, repeat
                 FROM Scheduler
                 WHERE canceled=0
                 ORDER BY next_event_time
         """
         ) as cur:
-            async for row in cur:
-                schedules += [StrippedSavedScheduleEvent.from_row(row)]
+            rows = await cur.fetchall()
+        schedules = [StrippedSavedScheduleEvent.from_row(row) for row in rows]
 
         logger.info("Populated %d schedules.", len(schedules))
 
-        async with self.heap_lock:
-            self.schedule_heap = schedules
-            heapq.heapify(self.schedule_heap)
+        # idx_scheduler_active_time serves this scan in time order, and a
+        # list sorted ascending already satisfies the min-heap invariant,
+        # so no heapify pass is needed
+        self.schedule_heap = [(schedule.next_event_time, schedule.id, schedule) for schedule in schedules]
 
         # Start the scheduler loop
         asyncio.create_task(self.scheduler_event_loop())
@@ -1173,6 +1160,7 @@ class Scheduler(Cog):
         # Close SQLite database
         logger.debug("Closing DB connection.")
         await self.db.close()
+        await self.db_read.close()
 
     async def _update_to_version_0(self) -> None:
         """
@@ -1183,7 +1171,9 @@ class Scheduler(Cog):
           - Add 3 indices to Scheduler
         """
         logger.info("[orange]Updating DB version to 0[/orange]", extra={"markup": True})
-        async with self.db.execute(
+        # One executescript runs all four DDL statements in a single hop
+        # through aiosqlite's worker thread
+        async with self.db.executescript(
             r"""
                 CREATE TABLE Scheduler (
                     id INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
@@ -1194,54 +1184,75 @@ class Scheduler(Cog):
                     next_event_time INTEGER,
                     repeat DOUBLE,
                     canceled BOOLEAN NOT NULL DEFAULT 0 CHECK (canceled IN (0, 1))
-                )
+                );
+                CREATE INDEX IF NOT EXISTS idx_scheduler_time ON Scheduler (next_event_time);
+                CREATE INDEX IF NOT EXISTS idx_scheduler_guild_author ON Scheduler (guild_id, author_id);
+                CREATE INDEX IF NOT EXISTS idx_scheduler_canceled ON Scheduler (canceled);
             """
         ):
             pass
 
-        async with self.db.execute(
+    async def _update_to_version_1(self) -> None:
+        """
+        Update DB to version 1.
+
+        Changes:
+          - Add version=1 row to Meta table
+          - Add mention column to Scheduler
+        """
+        logger.info("[orange]Updating DB version to 1[/orange]", extra={"markup": True})
+        async with self.db.executescript(
             r"""
-                CREATE INDEX IF NOT EXISTS idx_scheduler_time ON Scheduler (next_event_time)
+                INSERT INTO Meta(name, value) VALUES ('version', 1);
+                ALTER TABLE Scheduler
+                    ADD COLUMN mention BOOLEAN NOT NULL DEFAULT 0 CHECK (mention IN (0, 1));
             """
         ):
             pass
 
+    async def _update_to_version_2(self) -> None:
+        """
+        Update DB to version 2.
+
+        Changes:
+          - Add a partial composite index backing the list page/count queries
+        """
+        logger.info("[orange]Updating DB version to 2[/orange]", extra={"markup": True})
         async with self.db.execute(
             r"""
-                CREATE INDEX IF NOT EXISTS idx_scheduler_guild_author ON Scheduler (guild_id, author_id)
+                CREATE INDEX IF NOT EXISTS idx_scheduler_list
+                    ON Scheduler (author_id, guild_id, channel_id, next_event_time)
+                    WHERE canceled=0
             """
         ):
             pass
 
         async with self.db.execute(
             r"""
-                CREATE INDEX IF NOT EXISTS idx_scheduler_canceled ON Scheduler (canceled)
-            """
+            UPDATE Meta
+                SET value=2
+                WHERE name='version'
+        """
         ):
             pass
 
-    async def _update_to_version_1(self) -> None:
+    async def _update_to_version_3(self) -> None:
         """
-        Update DB to version 1.
+        Update DB to version 3.
 
         Changes:
-          - Add version=1 row to Meta table
-          - Add mention column to Scheduler
-        """
-        logger.info("[orange]Updating DB version to 1[/orange]", extra={"markup": True})
-        async with self.db.execute(
-            r"""
-            INSERT INTO Meta(name, value)
-            VALUES ('version', 1)
+          - Add a partial index on next_event_time for the active-events scan
+          - Drop idx_scheduler_canceled, superseded by the partial indexes
         """
-        ):
-            pass
-
-        async with self.db.execute(
+        logger.info("[orange]Updating DB version to 3[/orange]", extra={"markup": True})
+        async with self.db.executescript(
             r"""
-            ALTER TABLE Scheduler
-            ADD COLUMN mention BOOLEAN NOT NULL DEFAULT 0 CHECK (canceled IN (0, 1))
-        """
+                CREATE INDEX IF NOT EXISTS idx_scheduler_active_time
+                    ON Scheduler (next_event_time)
+                    WHERE canceled=0;
+                DROP INDEX IF EXISTS idx_scheduler_canceled;
+                UPDATE Meta SET value=3 WHERE name='version';
+            """
         ):
             pass
 
@@ -1252,6 +1263,22 @@ class Scheduler(Cog):
         logger.debug("Initiating DB connection.")
         self.db = await aiosqlite.connect(SCHEDULER_DATABASE_PATH)
 
+        # WAL lets list/show reads run while the scheduler loop writes, and
+        # NORMAL sync skips the per-commit fsync (WAL stays consistent on crash)
+        async with self.db.execute(r"PRAGMA journal_mode=WAL"):
+            pass
+        # Keep temp b-trees off disk, give the page cache ~8 MB, and let
+        # SQLite mmap the database file for reads
+        async with self.db.executescript(
+            r"""
+                PRAGMA synchronous=NORMAL;
+                PRAGMA temp_store=MEMORY;
+                PRAGMA cache_size=-8000;
+                PRAGMA mmap_size=134217728;
+            """
+        ):
+            pass
+
         # Checks if the meta table exists
         async with self.db.execute(
             r"""
@@ -1293,11 +1320,35 @@ class Scheduler(Cog):
                 await self._update_to_version_0()
             await self._update_to_version_1()
 
+        # Fetch the stored version and apply any newer migrations
+        async with self.db.execute(
+            r"""
+            SELECT value
+                FROM Meta
+                WHERE name='version'
+        """
+        ) as cur:
+            row = await cur.fetchone()
+        if row is None:
+            raise ValueError("Something went wrong with SQLite, the Meta version row should exist.")
+        db_version: int = row[0]
+
+        if db_version < 2:
+            await self._update_to_version_2()
+        if db_version < 3:
+            await self._update_to_version_3()
+
         await self.db.commit()  # commit the changes
 
-    logger.info("Using SQLite version %s.", aiosqlite.sqlite_version)
-    # Older versions don't support RETURNING in SQLite
-    if version.parse(aiosqlite.sqlite_version) >= version.parse("3.35.0"):
+        # Interactive reads (list/show/edit lookups) go through a separate
+        # read-only connection, so they never queue behind the scheduler
+        # loop's write batches on the main connection (WAL allows concurrent
+        # readers alongside the writer)
+        self.db_read = await aiosqlite.connect(f"file:{SCHEDULER_DATABASE_PATH}?mode=ro", uri=True)
+        async with self.db_read.execute(r"PRAGMA mmap_size=134217728"):
+            pass
+
+    if SQLITE_SUPPORTS_RETURNING:
 
         async def _insert_schedule(self, event: ScheduleEvent) -> SavedScheduleEvent:
             """
@@ -1309,19 +1360,19 @@ class Scheduler(Cog):
             :return: The saved SavedScheduleEvent.
             """
             async with self.db.execute(
-                r"""
+                rf"""
                     INSERT INTO Scheduler (message, guild_id, channel_id,
                                            author_id, next_event_time, repeat, mention)
                         VALUES ($message, $guild_id, $channel_id, $author_id,
                                 $next_event_time, $repeat, $mention)
-                        RETURNING *
+                        RETURNING {SCHEDULER_COLUMNS}
                 """,
                 {
                     "message": event.message,
                     "guild_id": event.channel.guild.id,
                     "channel_id": event.channel.id,
                     "author_id": event.author.id,
-                    "next_event_time": int(event.time.timestamp()),
+                    "next_event_time": event.time.int_timestamp,
                     "repeat": event.repeat,
                     "mention": int(event.mention),
                 },
@@ -1348,14 +1399,14 @@ class Scheduler(Cog):
             """
 
             async with self.db.execute(
-                r"""
+                rf"""
                         UPDATE Scheduler
                             SET message=$message,
                                 channel_id=$channel_id,
                                 mention=$mention,
                                 repeat=$repeat
                             WHERE id=$id
-                            RETURNING *
+                            RETURNING {SCHEDULER_COLUMNS}
                     """,
                 {
                     "id": original_event.id,
@@ -1389,14 +1440,14 @@ class Scheduler(Cog):
 
             logger.debug("Deleting event ID %d.", event_id)
             async with self.db.execute(
-                r"""
+                rf"""
                     UPDATE Scheduler
                         SET canceled=1
                         WHERE canceled=0
                             AND id=$id
                             AND author_id=$author_id
                             AND guild_id=$guild_id
-                        RETURNING *
+                        RETURNING {SCHEDULER_COLUMNS}
                 """,
                 {
                     "id": event_id,
@@ -1410,6 +1461,7 @@ class Scheduler(Cog):
                 event_db = SavedScheduleEvent.from_row(row)
 
             await self.db.commit()
+            self._canceled_ids.add(event_id)
             logger.info("Deleted event ID %d.", event_id)
             return event_db
 
@@ -1438,14 +1490,14 @@ class Scheduler(Cog):
                     "guild_id": event.channel.guild.id,
                     "channel_id": event.channel.id,
                     "author_id": event.author.id,
-                    "next_event_time": int(event.time.timestamp()),
+                    "next_event_time": event.time.int_timestamp,
                     "repeat": event.repeat,
                     "mention": int(event.mention),
                 },
             ) as cur:
                 async with self.db.execute(
-                    r"""
-                    SELECT *
+                    rf"""
+                    SELECT {SCHEDULER_COLUMNS}
                         FROM Scheduler
                         WHERE id=$id
                         LIMIT 1
@@ -1489,8 +1541,8 @@ class Scheduler(Cog):
                 },
             ) as cur:
                 async with self.db.execute(
-                    r"""
-                        SELECT *
+                    rf"""
+                        SELECT {SCHEDULER_COLUMNS}
                             FROM Scheduler
                             WHERE id=$id
                             LIMIT 1
@@ -1520,15 +1572,16 @@ class Scheduler(Cog):
 
             logger.debug("Deleting event ID %d.", event_id)
 
+            # Update first and check rowcount, so a failed delete (stale or
+            # foreign ID) costs one statement instead of two
             async with self.db.execute(
                 r"""
-                    SELECT *
-                        FROM Scheduler
+                    UPDATE Scheduler
+                        SET canceled=1
                         WHERE canceled=0
                             AND id=$id
                             AND author_id=$author_id
                             AND guild_id=$guild_id
-                        LIMIT 1
                 """,
                 {
                     "id": event_id,
@@ -1536,29 +1589,25 @@ class Scheduler(Cog):
                     "guild_id": guild_id,
                 },
             ) as cur:
-                row = await cur.fetchone()
-                if row is None:
+                if cur.rowcount != 1:
                     return None
-                event_db = SavedScheduleEvent.from_row(row)
 
             async with self.db.execute(
-                r"""
-                    UPDATE Scheduler
-                        SET canceled=1
-                        WHERE canceled=0
-                            AND id=$id
-                            AND author_id=$author_id
-                            AND guild_id=$guild_id
+                rf"""
+                    SELECT {SCHEDULER_COLUMNS}
+                        FROM Scheduler
+                        WHERE id=$id
+                        LIMIT 1
                 """,
-                {
-                    "id": event_id,
-                    "author_id": author_id,
-                    "guild_id": guild_id,
-                },
-            ):
-                pass
+                {"id": event_id},
+            ) as cur:
+                row = await cur.fetchone()
+                if row is None:
+                    raise ValueError("Something went wrong with SQLite, row should not be None.")
+                event_db = SavedScheduleEvent.from_row(row)
 
             await self.db.commit()
+            self._canceled_ids.add(event_id)
             logger.info("Deleted event ID %d.", event_id)
             return event_db
 
@@ -1586,7 +1635,7 @@ class Scheduler(Cog):
                 repeat_message = f"Every {repeat:.2f} minute{'s' if repeat != 1 else ''}"
             embed.add_field(name="Repeat", value=repeat_message, inline=True)
 
-        mentions = re.search(r"@(everyone|here|[!&]?[0-9]{17,20})", event.message)
+        mentions = MENTION_RE.search(event.message) if "@" in event.message else None
         if mentions is not None:  # has mentions
             embed.add_field(name="Ping Enabled", value="Yes" if event.mention else "No", inline=True)
         timestamp = int(event.next_event_time)
@@ -1665,21 +1714,21 @@ class Scheduler(Cog):
             raise ValueError("original_event must not be None when editing is True.")
 
         # Check is below limit TODO: Add constraints to DB
+        # Conditional aggregation fetches the guild and channel counts in one query
         async with self.db.execute(
             r"""
-            SELECT count(*)
+            SELECT count(*), coalesce(sum(channel_id=$channel_id), 0)
                 FROM Scheduler
                 WHERE canceled=0
                     AND author_id=$author_id
                     AND guild_id=$guild_id
-                    AND channel_id=$channel_id
         """,
             {"author_id": event.author.id, "guild_id": event.channel.guild.id, "channel_id": event.channel.id},
         ) as cur:
             row = await cur.fetchone()
         if row is None:
             raise ValueError("Row shouldn't be None here.")
-        count_channel = row[0]
+        count_guild, count_channel = row
 
         if count_channel >= self.PER_CHANNEL_LIMIT:
             logger.info(
@@ -1707,21 +1756,6 @@ class Scheduler(Cog):
             )
             return event_db
 
-        async with self.db.execute(
-            r"""
-            SELECT count(*)
-                FROM Scheduler
-                WHERE canceled=0
-                    AND author_id=$author_id
-                    AND guild_id=$guild_id
-        """,
-            {"author_id": event.author.id, "guild_id": event.channel.guild.id},
-        ) as cur:
-            row = await cur.fetchone()
-        if row is None:
-            raise ValueError("Row shouldn't be None here.")
-        count_guild = row[0]
-
         if count_guild >= self.PER_GUILD_LIMIT:
             logger.info(
                 "Failed to create event, user has too many guild events %s/%s.",
@@ -1746,8 +1780,9 @@ class Scheduler(Cog):
         )
 
         # Add the event into the schedule heap
-        async with self.heap_lock:
-            heapq.heappush(self.schedule_heap, event_db.strip())
+        stripped = event_db.strip()
+        heapq.heappush(self.schedule_heap, (stripped.next_event_time, stripped.id, stripped))
+        self._heap_updated.set()
         return event_db
 
     async def send_scheduled_message(self, stripped_event: StrippedSavedScheduleEvent) -> bool:
@@ -1760,8 +1795,8 @@ class Scheduler(Cog):
 
         # Check if the event was canceled
         async with self.db.execute(
-            r"""
-            SELECT *
+            rf"""
+            SELECT {SCHEDULER_COLUMNS}
                 FROM Scheduler
                 WHERE id=$id
         """,
@@ -1773,7 +1808,8 @@ class Scheduler(Cog):
                 return False
 
         event = SavedScheduleEvent.from_row(row)
-        stripped_event.repeat = event.repeat  # sync the stripped repeat status
+        # sync the stripped repeat status (minutes in the DB, seconds here)
+        stripped_event.repeat_seconds = None if event.repeat is None else int(event.repeat * 60)
 
         if event.canceled:  # if canceled is true
             logger.warning("Event with ID %d was canceled.", event.id)
@@ -1816,14 +1852,14 @@ class Scheduler(Cog):
             return False
 
         if event.mention and perms_author.mention_everyone:  # if mentions is enabled and author still has perms
-            allowed_mentions = discord.AllowedMentions.all()
+            allowed_mentions = MENTIONS_ALL
         else:
             if event.mention:
                 logger.debug(
                     "Event with ID %s mention disabled due to author doesn't have mention_everyone permission.",
                     event.id,
                 )
-            allowed_mentions = discord.AllowedMentions.none()
+            allowed_mentions = MENTIONS_NONE
         # channel has .send since invalid channel typed are filtered above with hasattr(channel, 'send')
         await channel.send(  # type: ignore[reportGeneralTypeIssues]
             event.message, allowed_mentions=allowed_mentions
@@ -1831,74 +1867,132 @@ class Scheduler(Cog):
         # TODO: add a "report abuse" feature/command, save all sent msg in a db table with the id
         return True
 
+    async def _dispatch_scheduled_message(self, event: StrippedSavedScheduleEvent) -> bool:
+        """
+        Send a single due event under the dispatch semaphore.
+
+        :param event: The stripped event to send.
+        :return: True if send was successful, False otherwise.
+        """
+        async with self._dispatch_sem:
+            try:
+                # Attempt to send the message
+                return await self.send_scheduled_message(event)
+            except Exception as e:
+                # Something unexpected went wrong
+                logger.error(
+                    "Something went wrong while sending the scheduled message with event ID %d.",
+                    event.id,
+                    exc_info=e,
+                )
+                return False
+
+    async def _dispatch_channel_events(
+        self, events: list[StrippedSavedScheduleEvent], results: dict[int, bool]
+    ) -> None:
+        """
+        Send one channel's due events sequentially, preserving their order.
+
+        :param events: The due events of a single channel, in due order.
+        :param results: Shared mapping of event ID to send success.
+        """
+        for event in events:
+            results[event.id] = await self._dispatch_scheduled_message(event)
+
     async def _scheduler_event_loop(self) -> None:
         """
         Internal iteration of the scheduler event loop.
         """
-        should_sleep = False
-        while not should_sleep:
-            should_sleep = True
+        # Drain everything currently due from the heap
+        due: list[StrippedSavedScheduleEvent] = []
+        now = time.time()
+        while self.schedule_heap:
+            # Peek at the next event; only pop once we know it leaves the
+            # heap, so idle ticks don't pay a pop/push pair
+            _, _, next_event = self.schedule_heap[0]
+
+            if next_event.id in self._canceled_ids:
+                # Deleted via the delete command after being queued; drop
+                # the stale entry without touching the database
+                heapq.heappop(self.schedule_heap)
+                self._canceled_ids.discard(next_event.id)
+                continue
+
+            # Time hasn't past yet, and neither has any event behind it
+            if next_event.next_event_time >= now:
+                break
+
+            heapq.heappop(self.schedule_heap)
+            due.append(next_event)
+
+        if not due:
+            return
 
-            if self.schedule_heap:
-                async with self.heap_lock:  # pop the next event from heap
-                    next_event = heapq.heappop(self.schedule_heap)
-
-                now = arrow.utcnow().timestamp()
-                # Time has past
-                if next_event.next_event_time < now:
-                    should_sleep = False
-                    try:
-                        # Attempt to send the message
-                        success = await self.send_scheduled_message(next_event)
-                    except Exception as e:
-                        # Something unexpected went wrong
-                        logger.error(
-                            "Something went wrong while sending the scheduled message with event ID %d.",
-                            next_event.id,
-                            exc_info=e,
-                        )
-                        success = False
-
-                    # The repeat time is updated within send_scheduled_message() in case of edits
-                    if not success or next_event.repeat is None:
-                        # If the message failed to send or the message isn't on repeat, then cancel the schedule
-                        async with self.db.execute(
-                            r"""
-                                UPDATE Scheduler
-                                    SET canceled=1
-                                    WHERE id=$id
-                            """,
-                            {"id": next_event.id},
-                        ):
-                            pass
-                        await self.db.commit()
-                        if not success:
-                            logger.info("Canceled %s because it failed.", next_event)
-
-                    else:
-                        # Otherwise, update the next_event_time
-                        new_event = next_event.do_repeat(int(now))
-                        async with self.db.execute(
-                            r"""
-                                UPDATE Scheduler
-                                    SET next_event_time=$next_event_time
-                                    WHERE id=$id
-                            """,
-                            {"next_event_time": new_event.next_event_time, "id": next_event.id},
-                        ):
-                            pass
-                        await self.db.commit()
-                        # re-add the updated event
-                        async with self.heap_lock:
-                            heapq.heappush(self.schedule_heap, new_event)
-                else:
-                    # re-add the original event when the time isn't up yet
-                    async with self.heap_lock:
-                        heapq.heappush(self.schedule_heap, next_event)
+        # Deliver channels concurrently (bounded by the semaphore), so one
+        # slow or rate-limited channel doesn't head-of-line block the others;
+        # within a channel events still go out in due order
+        by_channel: dict[int, list[StrippedSavedScheduleEvent]] = {}
+        for event in due:
+            by_channel.setdefault(event.channel_id, []).append(event)
+        results: dict[int, bool] = {}
+        await asyncio.gather(*(self._dispatch_channel_events(events, results) for events in by_channel.values()))
+
+        # Per-event writes are collected and flushed in a single transaction
+        # below, instead of one commit per due event
+        canceled: list[dict[str, int]] = []
+        rescheduled: list[dict[str, int]] = []
+        requeue: list[tuple[int, int, StrippedSavedScheduleEvent]] = []
+        now_int = int(time.time())
+        for next_event in due:
+            success = results[next_event.id]
+            # The repeat time is updated within send_scheduled_message() in case of edits
+            if not success or next_event.repeat_seconds is None:
+                # If the message failed to send or the message isn't on repeat, then cancel the schedule
+                canceled += [{"id": next_event.id}]
+                if not success:
+                    logger.info("Canceled %s because it failed.", next_event)
+
+            else:
+                # Otherwise, update the next_event_time
+                new_event = next_event.do_repeat(now_int)
+                rescheduled += [{"next_event_time": new_event.next_event_time, "id": new_event.id}]
+                requeue.append((new_event.next_event_time, new_event.id, new_event))
+
+        # Re-add the updated events: for large catch-up drains one O(n)
+        # heapify beats per-event O(log n) pushes
+        if len(requeue) >= 8:
+            self.schedule_heap.extend(requeue)
+            heapq.heapify(self.schedule_heap)
+        else:
+            for entry in requeue:
+                heapq.heappush(self.schedule_heap, entry)
+
+        if canceled:
+            async with self.db.executemany(
+                r"""
+                    UPDATE Scheduler
+                        SET canceled=1
+                        WHERE id=$id
+                """,
+                canceled,
+            ):
+                pass
+        if rescheduled:
+            async with self.db.executemany(
+                r"""
+                    UPDATE Scheduler
+                        SET next_event_time=$next_event_time
+                        WHERE id=$id
+                """,
+                rescheduled,
+            ):
+                pass
+        if canceled or rescheduled:
+            await self.db.commit()
 
     async def scheduler_event_loop(self) -> None:
         """
-        The main scheduler event loop, checks every second.
+        The main scheduler event loop, sleeps until the next event is due.
         """
         await self.bot.wait_until_ready()
 
@@ -1907,7 +2001,19 @@ class Scheduler(Cog):
                 await self._scheduler_event_loop()
             except Exception as e:
                 logger.error("An uncaught error was raised during scheduled event loop.", exc_info=e)
-            await asyncio.sleep(1)
+
+            # Sleep until the next event is due (capped at 60s as a safety
+            # net); a newly created schedule wakes the loop early so an
+            # earlier-due event isn't stuck behind a long sleep
+            if self.schedule_heap:
+                delay = min(60.0, max(0.05, self.schedule_heap[0][0] - time.time()))
+            else:
+                delay = 60.0
+            try:
+                await asyncio.wait_for(self._heap_updated.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+            self._heap_updated.clear()
 
     async def _schedule_create(self, ctx: commands.Context[Bot], channel: MessageableGuildChannel | None) -> None:
         """
@@ -2015,9 +2121,9 @@ class Scheduler(Cog):
             raise ValueError("Shouldn't be None here.")
 
         # TODO: support DM without guild check
-        async with self.db.execute(
-            r"""
-                SELECT *
+        async with self.db_read.execute(
+            rf"""
+                SELECT {SCHEDULER_COLUMNS}
                     FROM Scheduler
                     WHERE canceled=0
                         AND id=$id
@@ -2095,9 +2201,9 @@ class Scheduler(Cog):
                 await ctx.reply(embed=embed)
                 return
 
-        async with self.db.execute(
-            r"""
-                SELECT *
+        async with self.db_read.execute(
+            rf"""
+                SELECT {SCHEDULER_COLUMNS}
                     FROM Scheduler
                     WHERE canceled=0
                         AND id=$id
@@ -2152,7 +2258,7 @@ class Scheduler(Cog):
         else:
             # Otherwise, directly open the modal
             await ctx.interaction.response.send_modal(
-                get_schedule_edit_modal(raw_values)(self, new_channel, original_event)
+                ScheduleEditModal(self, new_channel, original_event, defaults=raw_values)
             )
 
     @commands.guild_only()
@@ -5,10 +5,14 @@ The main Bot class.
 """
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
-import tomli
+try:
+    import tomllib  # type: ignore[reportMissingImports]  # stdlib on Python 3.11+
+except ModuleNotFoundError:  # Python < 3.11
+    import tomli as tomllib  # type: ignore[reportMissingImports]
 
 import discord
 from discord.ext import commands
@@ -40,9 +44,9 @@ class Bot(commands.Bot):
             help_command=HelpCmd(),
         )
 
-        with open(PYPROJECT_TOML_PATH) as f:
+        with open(PYPROJECT_TOML_PATH, "rb") as f:
             logger.info("Loading pyproject.toml to parse version.")
-            toml_dict = tomli.loads(f.read())
+            toml_dict = tomllib.load(f)
         self.version: str = toml_dict["project"]["version"]
         logger.info("[bold green]Bot version: %s[/bold green]", self.version, extra={"markup": True})
 
@@ -62,15 +66,21 @@ class Bot(commands.Bot):
             if not DEBUG_MODE:
                 # Sync global slash commands
                 await self.tree.sync()
-                for guild_id in DEBUG_GUILDS:  # remove debug commands
-                    await self.tree.sync(guild=discord.Object(guild_id))
+                if DEBUG_GUILDS:  # remove debug commands, one concurrent sync per guild
+                    await asyncio.gather(
+                        *(self.tree.sync(guild=discord.Object(guild_id)) for guild_id in DEBUG_GUILDS)
+                    )
                 logger.info("Slash commands synced.")
             else:
-                # Sync debug guilds slash commands
-                for guild_id in DEBUG_GUILDS:
+
+                async def sync_debug_guild(guild_id: int) -> None:
                     self.tree.copy_global_to(guild=discord.Object(guild_id))
                     await self.tree.sync(guild=discord.Object(guild_id))
                     logger.info("Synced app command tree to debug guild %d.", guild_id)
+
+                # Sync debug guilds slash commands concurrently; each sync is
+                # its own HTTP round-trip
+                await asyncio.gather(*map(sync_debug_guild, DEBUG_GUILDS))
         else:
             logger.info("Slash commands sync skipped.")
 
@@ -122,7 +132,7 @@ class Bot(commands.Bot):
 
             to_string = [self._get_name(x) for x in exception.converters]
             if len(to_string) > 2:
-                fmt = "{}, or {}".format(", ".join(to_string[:-1]), to_string[-1])
+                fmt = ", ".join(to_string[:-1]) + ", or " + to_string[-1]
             else:
                 fmt = " or ".join(to_string)
             arg = discord.utils.escape_markdown(context.current_argument or "", ignore_links=False)
@@ -8,7 +8,7 @@ from __future__ import annotations
 import logging
 import os
 import time
-from distutils.util import strtobool
+from typing import Final
 
 from dotenv import load_dotenv  # type: ignore[reportUnknownVariableType]
 
@@ -29,10 +29,30 @@ __all__ = [
 
 logger = logging.getLogger(__name__)
 
+_TRUE_VALUES = frozenset({"y", "yes", "t", "true", "on", "1"})
+_FALSE_VALUES = frozenset({"n", "no", "f", "false", "off", "0"})
+
+
+def _strtobool(value: str) -> bool:
+    """
+    Convert an env flag string to a bool. Accepts the same values the removed
+    distutils.util.strtobool did.
+
+    :param value: The string to convert.
+    :raises ValueError: If the string isn't a recognized truth value.
+    """
+    value = value.strip().lower()
+    if value in _TRUE_VALUES:
+        return True
+    if value in _FALSE_VALUES:
+        return False
+    raise ValueError(f"invalid truth value {value!r}")
+
+
 # Load envs
 load_dotenv()
 
-DEBUG_MODE = strtobool(os.getenv("DEBUG_MODE", "off"))
+DEBUG_MODE: Final = _strtobool(os.getenv("DEBUG_MODE", "off"))
 if DEBUG_MODE:
     logger.warning("[red]Debug mode is activated.[/red]", extra={"markup": True})
 
@@ -42,18 +62,19 @@ except KeyError:
     logger.critical("[bold red]TOKEN not set.[/bold red]", extra={"markup": True})
     exit(1)
 
-PREFIX = os.getenv("PREFIX", "=")
+PREFIX: Final = os.getenv("PREFIX", "=")
 
 # Sets the embed colour, 0x749DA1 is teal
-COLOUR = Colour(0x749DA1)
+COLOUR: Final = Colour(0x749DA1)
+
+# The repository root (parent of src/)
+_BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 # Default is ../data/schedule.db
-SCHEDULER_DATABASE_NAME = "schedule.db"
-SCHEDULER_DATABASE_PATH = os.path.join(
-    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", SCHEDULER_DATABASE_NAME
-)
+SCHEDULER_DATABASE_NAME: Final = "schedule.db"
+SCHEDULER_DATABASE_PATH: Final = os.path.join(_BASE_DIR, "data", SCHEDULER_DATABASE_NAME)
 
-PYPROJECT_TOML_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "pyproject.toml")
+PYPROJECT_TOML_PATH: Final = os.path.join(_BASE_DIR, "pyproject.toml")
 
 # Configure debug servers
 if "DEBUG_GUILDS" in os.environ:
@@ -83,7 +104,7 @@ elif "DEBUG_GUILD" in os.environ:
 else:
     DEBUG_GUILDS = []  # type: ignore[reportConstantRedefinition]
 
-SYNC_SLASH_COMMANDS = strtobool(os.getenv("SYNC_SLASH_COMMANDS", "on"))
+SYNC_SLASH_COMMANDS: Final = _strtobool(os.getenv("SYNC_SLASH_COMMANDS", "on"))
 
 # Get timezone env
 original_tz = os.getenv("TZ")
@@ -126,4 +147,4 @@ except ModuleNotFoundError:
     pass  # dateparser is not used
 
 
-TIME_LANG = ["en"]
+TIME_LANG: Final = ["en"]
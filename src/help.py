@@ -57,10 +57,11 @@ class HelpCmd(commands.DefaultHelpCommand):
 
         # noinspection PyProtectedMember
         get_width = discord.utils._string_width  # type: ignore  # dpy type issue
+        indent = self.indent * " "
         for command in commands:
             name = f"`{command.qualified_name}`"
             width = max_size - (get_width(name) - len(name))
-            entry = f'{self.indent * " "}{name:<{width}} {command.short_doc}'
+            entry = f"{indent}{name:<{width}} {command.short_doc}"
             self.paginator.add_line(self.shorten_text(entry))
 
     async def send_pages(self) -> None:
@@ -7,41 +7,67 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import signal
 import sys
+from typing import TYPE_CHECKING
 
-from src.bot import Bot
+if TYPE_CHECKING:
+    from src.bot import Bot
 
 logger = logging.getLogger(__name__)
 
 
+async def main(bot: Bot) -> None:
+    """
+    The main runner for the bot.
+
+    :param bot: The Bot instance to run.
+    """
+    loop = asyncio.get_running_loop()
+    if sys.version_info >= (3, 12):
+        # Start tasks eagerly so coroutines that finish without suspending
+        # (cache hits, permission checks) skip a full event-loop trip
+        loop.set_task_factory(asyncio.eager_task_factory)
+    try:
+        # Container runtimes stop with SIGTERM; close the bot cleanly rather
+        # than tearing the loop down through cancellation unwinding
+        loop.add_signal_handler(signal.SIGTERM, lambda: asyncio.ensure_future(bot.close()))
+    except NotImplementedError:
+        pass  # signal handlers are not supported on this platform (Windows)
+    async with bot:
+        # The cogs are independent, so load them concurrently
+        await asyncio.gather(
+            bot.load_extension("cogs.scheduler"),
+            bot.load_extension("cogs.general"),
+        )
+        logger.info("[green]Starting bot.[/green]", extra={"markup": True})
+        await bot.start()
+
+
 if __name__ == "__main__":
-    bot = Bot()
+    # Deferred so importing start.py (linters, test collectors) doesn't pull
+    # in the whole discord.py stack
+    from src.bot import Bot
 
-    async def main() -> None:
-        """
-        The main runner for the bot.
-        """
-        async with bot:
-            await bot.load_extension("cogs.scheduler")
-            await bot.load_extension("cogs.general")
-            logger.info("[green]Starting bot.[/green]", extra={"markup": True})
-            await bot.start()
+    bot = Bot()
 
     try:
         try:
             import uvloop
         except ModuleNotFoundError:
             logger.info("uvloop not installed.")
-            asyncio.run(main())
+            asyncio.run(main(bot))
         else:
             # Start event loop
-            if sys.version_info >= (3, 11):
+            if hasattr(uvloop, "run"):  # uvloop >= 0.17
+                uvloop.run(main(bot))
+            elif sys.version_info >= (3, 11):
                 # noinspection PyUnresolvedReferences
                 with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
-                    runner.run(main())
+                    runner.run(main(bot))
             else:
                 uvloop.install()
-                asyncio.run(main())
+                asyncio.run(main(bot))
             del uvloop  # remove local variable
     except KeyboardInterrupt:
         pass